@@ -4,9 +4,15 @@ mainly, capturing training data, but also some for displaying data
 """
 import cv2
 from datetime import datetime
+import functools
 from importlib.resources import files, as_file
 import os
 from pathlib import Path
+import queue
+import shutil
+import subprocess
+import sys
+import threading
 import time
 
 import logging
@@ -14,6 +20,70 @@ logging.getLogger(__name__)
 
 data_dir = Path(__file__).parent / "data"
 
+
+def _open_webcam(device=0):
+    """
+    Open the default video device with a minimal driver-side frame buffer, in MJPG format.
+
+    Uses the native backend where one is known (DirectShow on Windows, V4L2 on Linux),
+    and requests a buffer size of 1 so each read/grab returns the freshest frame
+    instead of one queued up seconds ago. Not every backend honors the buffer size.
+
+    Also requests MJPG instead of the usual uncompressed YUYV default. MJPG frames are
+    decoded with libjpeg-turbo rather than a per-frame YUYV to BGR conversion, and use far
+    less USB bandwidth: at 1080p many UVC webcams deliver 30 fps in MJPG but only ~5 fps
+    in YUYV. Whether the camera accepted the format is logged.
+
+    Returns
+    -------
+    cap : cv2.VideoCapture
+        Capture object; check cap.isOpened() before use.
+    """
+    if os.name == "nt":
+        backend = cv2.CAP_DSHOW
+    elif sys.platform.startswith("linux"):
+        backend = cv2.CAP_V4L2
+    else:
+        backend = cv2.CAP_ANY
+
+    cap = cv2.VideoCapture(device, backend)
+    if not cap.isOpened():
+        return cap
+
+    if not cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+        logging.debug("Webcam backend ignored request for buffer size 1.")
+
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+    fourcc_code = int(cap.get(cv2.CAP_PROP_FOURCC))
+    fourcc = "".join(chr((fourcc_code >> 8 * i) & 0xFF) for i in range(4))
+    if fourcc == "MJPG":
+        logging.info("Webcam using MJPG format.")
+    else:
+        logging.info(f"Webcam did not accept MJPG format, using {fourcc!r}.")
+    return cap
+
+
+# Red circle drawn in top left corner of preview frames that are being saved as snapshots
+CIRCLE_CENTER = (30, 30)
+CIRCLE_RADIUS = 25
+CIRCLE_COLOR = (0, 0, 255)  # BGR
+
+# Seconds to wait before retrying after the webcam fails to deliver a frame in headless snapshot mode
+CAMERA_RETRY_DELAY = 1.0
+
+# Largest (width, height) of live preview windows; larger frames are shrunk to fit before display
+PREVIEW_SIZE = (640, 480)
+
+# H.264 encoders to try when writing video with ffmpeg, fastest first (hardware, then software),
+# each with options favoring encode speed
+FFMPEG_ENCODERS = {
+    "h264_nvenc": ["-preset", "llhp", "-b:v", "8M", "-pix_fmt", "yuv420p"],  # NVIDIA
+    "h264_amf": ["-quality", "speed", "-b:v", "8M", "-pix_fmt", "yuv420p"],  # AMD
+    "h264_qsv": ["-preset", "veryfast", "-b:v", "8M", "-pix_fmt", "nv12"],  # Intel
+    "libx264": ["-preset", "ultrafast", "-pix_fmt", "yuv420p"],  # CPU
+}
+
+
 def show_test_image():
     logging.info("Showing built-in image...click anywhere in image to close")
     image_path = data_dir / "test_image.png"
@@ -71,14 +141,120 @@ def show_test_video(fps=30):
     cv2.destroyAllWindows()  # Close all OpenCV windows
 
 
+@functools.lru_cache(maxsize=None)
+def _find_ffmpeg_encoder():
+    """
+    Find ffmpeg and the fastest H.264 encoder from FFMPEG_ENCODERS that works on this machine.
+    Result is cached, so the probing only happens once per session.
+
+    Returns
+    -------
+    (ffmpeg_path, encoder) : tuple of str, or None
+        None if ffmpeg is not installed or none of the encoders work.
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        return None
+
+    try:
+        listing = subprocess.run([ffmpeg, "-hide_banner", "-encoders"],
+                                 capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError) as e:
+        logging.warning(f"Could not query ffmpeg encoders: {e}")
+        return None
+
+    for encoder, options in FFMPEG_ENCODERS.items():
+        if f" {encoder} " not in listing:
+            continue
+        # hardware encoders are often compiled in without the hardware being present,
+        # so confirm with a tiny test encode
+        test_command = [ffmpeg, "-hide_banner", "-loglevel", "error",
+                        "-f", "lavfi", "-i", "color=size=256x256:rate=30:duration=0.1",
+                        "-c:v", encoder, *options, "-f", "null", "-"]
+        try:
+            result = subprocess.run(test_command, capture_output=True, timeout=10)
+        except (OSError, subprocess.SubprocessError):
+            continue
+        if result.returncode == 0:
+            return ffmpeg, encoder
+
+    return None
+
+
+class _FFmpegWriter:
+    """
+    Stand-in for cv2.VideoWriter (write/release) that pipes raw BGR frames
+    to an ffmpeg subprocess for encoding.
+    """
+
+    def __init__(self, video_path, fps, frame_size, ffmpeg, encoder):
+        width, height = frame_size
+        command = [ffmpeg, "-y", "-hide_banner", "-loglevel", "error",
+                   "-f", "rawvideo", "-pix_fmt", "bgr24",
+                   "-s", f"{width}x{height}", "-r", f"{fps}", "-i", "-",
+                   "-c:v", encoder, *FFMPEG_ENCODERS[encoder], str(video_path)]
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        self.failed = False # set if ffmpeg stops accepting frames or exits with an error
+        self.dropped_frames = 0
+
+    def write(self, frame):
+        if self.failed:
+            self.dropped_frames += 1
+            return
+        try:
+            # frames from OpenCV are contiguous, so write the buffer without a copy
+            self.process.stdin.write(frame.data)
+        except OSError as e:
+            logging.warning(f"ffmpeg stopped accepting frames: {e}")
+            self.failed = True
+            self.dropped_frames += 1
+
+    def release(self):
+        """
+        Finish encoding and wait for ffmpeg to exit. Logs a warning and 
+        sets failed if any frames were dropped or ffmpeg reported an error.
+        """
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        returncode = self.process.wait()
+        if self.dropped_frames:
+            logging.warning(f"{self.dropped_frames} frames were not encoded because ffmpeg stopped accepting input.")
+        if returncode != 0:
+            logging.warning(f"ffmpeg exited with error code {returncode}.")
+            self.failed = True
+
+
 def capture_video(filepath, fps=30, duration=5):
+    """
+    Capture video from the default video device and save it to disk, 
+    displaying it while recording. Press any key to stop early.
+
+    Video is encoded with ffmpeg (captured_test.mp4) using the fastest available 
+    H.264 encoder, or with OpenCV (captured_test.avi) if ffmpeg isn't available.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Directory to save video in.
+    fps : float
+        Maximum frames per second (capped at the webcam's frame rate).
+    duration : float
+        Length of video to capture (seconds).
+
+    Returns
+    -------
+    video_path : Path or None
+        Path to saved video, or None if the webcam couldn't be opened 
+        or encoding failed.
+    """
     logging.info(f"Capturing {duration} seconds of video at up to {fps} FPS...")
     filepath = Path(filepath)
-    video_path = filepath / "captured_test.avi"
 
     # Open webcam
     logging.info("Setting up webcam and video writer... this may take a moment.")
-    cap = cv2.VideoCapture(0)
+    cap = _open_webcam()
     if not cap.isOpened():
         logging.warning("Error: Could not open webcam.")
         return
@@ -95,33 +271,107 @@ def capture_video(filepath, fps=30, duration=5):
     height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
     logging.info(f"Video resolution: {width}x{height}")
 
-    # VideoWriter setup
-    fourcc = cv2.VideoWriter_fourcc(*'XVID')
-    out = cv2.VideoWriter(str(video_path), fourcc, actual_fps, (width, height))
+    # Video writer setup: ffmpeg with the fastest available H.264 encoder (hardware if possible),
+    # falling back to OpenCV's XVID writer if ffmpeg isn't available
+    ffmpeg_encoder = _find_ffmpeg_encoder()
+    if ffmpeg_encoder is not None:
+        ffmpeg, encoder = ffmpeg_encoder
+        video_path = filepath / "captured_test.mp4"
+        logging.info(f"Encoding with ffmpeg ({encoder})")
+        out = _FFmpegWriter(video_path, actual_fps, (width, height), ffmpeg, encoder)
+    else:
+        video_path = filepath / "captured_test.avi"
+        logging.info("No working ffmpeg H.264 encoder found, encoding with OpenCV (XVID)")
+        fourcc = cv2.VideoWriter_fourcc(*'XVID')
+        out = cv2.VideoWriter(str(video_path), fourcc, actual_fps, (width, height))
 
     # Number of frames to capture
     total_frames = int(actual_fps * duration)
     logging.info(f"Capturing {total_frames} frames...")
 
-    logging.info("Setup complete -- starting capture now!")
-    frame_count = 0
-    while frame_count < total_frames:
-        ret, frame = cap.read()
-        if not ret:
-            break
+    # Three-stage pipeline so grabbing, display, and encoding overlap:
+    # reader thread -> read_q -> main thread (display) -> write_q -> writer thread
+    # None is used as the end-of-stream sentinel on both queues.
+    read_q = queue.Queue(maxsize=4)
+    write_q = queue.Queue(maxsize=4)
+    stop_event = threading.Event()
+    write_failed = threading.Event()
+
+    def read_frames():
+        try:
+            frame_count = 0
+            while frame_count < total_frames and not stop_event.is_set():
+                if not cap.grab():
+                    break
+                ret, frame = cap.retrieve()
+                if not ret:
+                    break
+                read_q.put(frame)
+                frame_count += 1
+        finally:
+            # always end the stream, even if the camera raised (e.g., device disconnected),
+            # so the main thread is never left waiting on read_q
+            read_q.put(None)
+
+    def write_frames():
+        writer_done = False
+        try:
+            while not writer_done:
+                frame = write_q.get()
+                writer_done = frame is None
+                if not writer_done:
+                    out.write(frame)
+        except Exception:
+            write_failed.set()
+            raise
+        finally:
+            # if writing failed, keep consuming until the sentinel so the
+            # main thread is never blocked on a full write_q
+            while not writer_done:
+                writer_done = write_q.get() is None
+
+    reader = threading.Thread(target=read_frames, daemon=True)
+    writer = threading.Thread(target=write_frames, daemon=True)
 
-        out.write(frame)
-        cv2.imshow("Captured Video", frame)
-        if cv2.waitKey(int(1000 / actual_fps)) & 0xFF != 255:
-            break  # Exit if any key is pressed
+    logging.info("Setup complete -- starting capture now!")
+    reader.start()
+    writer.start()
+    reader_done = False
+    # loop invariants: delay between frames (ms), and functions bound to locals for fast lookup
+    frame_delay_ms = int(1000 / actual_fps)
+    get_frame, put_frame = read_q.get, write_q.put
+    imshow, wait_key = cv2.imshow, cv2.waitKey
+    try:
+        while True:
+            frame = get_frame()
+            if frame is None:
+                reader_done = True
+                break
 
-        frame_count += 1
+            put_frame(frame)
+            imshow("Captured Video", frame)
+            if wait_key(frame_delay_ms) & 0xFF != 255:
+                break  # Exit if any key is pressed
+    finally:
+        # stop the reader and drain read_q so it is never blocked on a full queue
+        stop_event.set()
+        while not reader_done:
+            reader_done = read_q.get() is None
+        reader.join()
+        # writer finishes encoding whatever is queued before exiting
+        write_q.put(None)
+        writer.join()
+
+        # Cleanup
+        cap.release()
+        out.release()
+        cv2.destroyAllWindows()
 
-    # Cleanup
-    cap.release()
-    out.release()
-    cv2.destroyAllWindows()
+    if write_failed.is_set() or getattr(out, "failed", False):
+        logging.warning(f"Encoding failed, video at {video_path} may be incomplete or missing.")
+        return None
     logging.info(f"Video saved to {video_path}")
+    return video_path
 
 
 def get_snapshot(image_path, show=True):
@@ -142,7 +392,7 @@ def get_snapshot(image_path, show=True):
     """
     image_path = Path(image_path)
 
-    cap = cv2.VideoCapture(0)
+    cap = _open_webcam()
     if not cap.isOpened():
         logging.warning("Error: Could not open webcam.")
         return None
@@ -183,7 +433,8 @@ def get_snapshots(directory, filename_stem="image",
     display_interval : float
         How often to refresh the display (seconds).
     show : bool
-        Whether to show a live window with captured images.
+        Whether to show a live window with captured images. If False, 
+        sleeps between snapshots and only reads the camera when one is due.
 
     Returns
     -------
@@ -192,7 +443,7 @@ def get_snapshots(directory, filename_stem="image",
     directory = Path(directory)
     directory.mkdir(parents=True, exist_ok=True)
 
-    cap = cv2.VideoCapture(0)
+    cap = _open_webcam()
     if not cap.isOpened():
         logging.warning("Error: Could not open webcam.")
         return
@@ -200,50 +451,145 @@ def get_snapshots(directory, filename_stem="image",
     logging.info(f"Saving snapshots to {directory}")
     logging.info(f"Saving every {save_interval:.1f}s for {duration:.1f}s")
 
-    start_time = time.time()
+    # Encode and write snapshots on a background thread so saving doesn't stall
+    # the capture loop. Items are (path, frame, count), with None as the stop sentinel.
+    save_q = queue.Queue()
+
+    def write_snapshots():
+        while True:
+            item = save_q.get()
+            if item is None:
+                break
+            path, frame, count = item
+            # lowest PNG compression level: much faster to encode, slightly larger files
+            cv2.imwrite(str(path), frame, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+            logging.info(f"\t[{count}] Saved: {path.name}")
+
+    writer = threading.Thread(target=write_snapshots, daemon=True)
+    writer.start()
+
+    # monotonic clock is immune to system clock changes; snapshots are scheduled on a fixed
+    # grid (start_time + k*save_interval) so processing delays don't accumulate as drift
+    start_time = time.monotonic()
+    end_time = start_time + duration
     next_snapshot_time = start_time
+    last_display_time = start_time - display_interval
+    preview_size = None  # (width, height) of displayed frames, set from the first frame shown
     snapshot_count = 0
-    display_refresh_delay = int(display_interval*1000) # convert interval to ms (opencv units)
+    # Display loop polls keys briefly (ms, opencv units) rather than sleeping a whole display_interval:
+    # grab() already paces the loop at the camera frame rate, and frames in between displays are
+    # grabbed but never decoded
+    key_poll_delay = 1
+
+    def take_snapshot(frame, current_time):
+        # queue frame for saving and schedule the next snapshot
+        nonlocal snapshot_count, next_snapshot_time
+        timestamp = datetime.now().strftime("%m_%d_%H_%M_%S_%f")[:-3]
+        filename = f"{filename_stem}_{timestamp}.png"
+        path = directory / filename
+        # retrieve() returns a new array each call and the display path only draws on
+        # a copy, so frame can be handed to the writer thread as is
+        save_q.put((path, frame, snapshot_count))
+        snapshot_count += 1
+        next_snapshot_time += save_interval
+        if next_snapshot_time <= current_time:
+            # fell behind by more than an interval: skip missed slots rather than bursting
+            next_snapshot_time = current_time + save_interval
 
     try:
-        while True:
-            current_time = time.time()
-            if current_time - start_time > duration:
-                break
+        if not show:
+            # Headless: nothing to display, so sleep until each snapshot is due
+            # and only read a frame then, instead of polling the camera.
+            # While sleeping, the driver buffer fills with frames that are stale by the time
+            # a snapshot is due. _open_webcam asks for a buffer of 1 but not every backend
+            # honors it, so discard as many frames as the backend reports buffering
+            # (V4L2 defaults to 4). Unsupported backends report 0 or a negative value.
+            buffered_frames = int(cap.get(cv2.CAP_PROP_BUFFERSIZE))
+            stale_frames = buffered_frames if buffered_frames > 0 else 4
+            camera_ok = True
+            while True:
+                current_time = time.monotonic()
+                if current_time > end_time:
+                    break
+                if current_time < next_snapshot_time:
+                    time.sleep(min(next_snapshot_time, end_time) - current_time)
+                    continue
+
+                for _ in range(stale_frames):
+                    cap.grab()
+                ret = cap.grab()
+                if ret:
+                    ret, frame = cap.retrieve()
+                if not ret:
+                    # back off rather than spin if the camera is disconnected or stalled
+                    if camera_ok:
+                        logging.warning("Could not read frame from webcam, retrying.")
+                    camera_ok = False
+                    time.sleep(max(0, min(CAMERA_RETRY_DELAY, end_time - time.monotonic())))
+                    continue
+                camera_ok = True
+                take_snapshot(frame, current_time)
+
+        else:
+            # functions bound to locals for fast lookup in the display loop
+            monotonic, imshow, wait_key = time.monotonic, cv2.imshow, cv2.waitKey
+            while True:
+                current_time = monotonic()
+                if current_time > end_time:
+                    break
 
-            ret, frame = cap.read()
-            if not ret:
-                continue
-
-            save_this_frame = False
-            if current_time >= next_snapshot_time:
-                timestamp = datetime.now().strftime("%m_%d_%H_%M_%S_%f")[:-3]
-                filename = f"{filename_stem}_{timestamp}.png"
-                path = directory / filename
-                cv2.imwrite(str(path), frame)
-                logging.info(f"\t[{snapshot_count}] Saved: {path.name}")
-                snapshot_count += 1
-                next_snapshot_time = current_time + save_interval
-                save_this_frame = True  # use to draw red circle on frames that are being captured
-
-            if show:
-                display_frame = frame.copy()
-                if save_this_frame:
-                    cv2.circle(display_frame, (30, 30), 25, (0, 0, 255), -1)  # draw red circle in top left corner: center, radius, color
-                cv2.imshow("Snapshot", display_frame)
-
-                key = cv2.waitKey(display_refresh_delay) & 0xFF
+                # grab every pass to keep the stream current, but only decode (retrieve)
+                # frames that will actually be saved or displayed
+                ret = cap.grab()
+                if not ret:
+                    continue
+
+                snapshot_due = current_time >= next_snapshot_time
+                display_due = current_time - last_display_time >= display_interval
+                frame = None
+                if snapshot_due or display_due:
+                    ret, frame = cap.retrieve()
+                    if not ret:
+                        continue
+
+                save_this_frame = False
+                if snapshot_due:
+                    take_snapshot(frame, current_time)
+                    save_this_frame = True  # use to draw red circle on frames that are being captured
+
+                if frame is not None:
+                    if preview_size is None:
+                        # shrink (never enlarge) to fit within PREVIEW_SIZE, keeping aspect ratio
+                        height, width = frame.shape[:2]
+                        scale = min(PREVIEW_SIZE[0] / width, PREVIEW_SIZE[1] / height, 1.0)
+                        preview_size = (round(width * scale), round(height * scale))
+
+                    # full-size frame is kept for saving; resize returns a new array
+                    if preview_size != (frame.shape[1], frame.shape[0]):
+                        display_frame = cv2.resize(frame, preview_size, interpolation=cv2.INTER_AREA)
+                    else:
+                        display_frame = frame
+                    # imshow copies internally, so only copy frame when drawing on it
+                    # (the saved snapshot must stay unmarked)
+                    if save_this_frame:
+                        if display_frame is frame:
+                            display_frame = frame.copy()
+                        cv2.circle(display_frame, CIRCLE_CENTER, CIRCLE_RADIUS, CIRCLE_COLOR, -1)
+                    imshow("Snapshot", display_frame)
+                    last_display_time = current_time
+
+                key = wait_key(key_poll_delay) & 0xFF
                 if key != 255:
                     logging.info("Key press detected — exiting early.")
                     break
-            else:
-                # Even if not showing, sleep to avoid tight loop
-                cv2.waitKey(display_refresh_delay)
 
     except KeyboardInterrupt:
         logging.warning("Interrupted by user.")
 
     finally:
+        # finish writing any queued snapshots
+        save_q.put(None)
+        writer.join()
         cap.release()
         cv2.destroyAllWindows()
         logging.info("Done. Released camera.")
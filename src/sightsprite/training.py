@@ -2,20 +2,46 @@
 sightsprite utilities for training once data is acquired using capture module.  
 Has utilities for labeling data, sorting it into folders, and training models. 
 """
+from concurrent.futures import ThreadPoolExecutor
+import csv
+import cv2
+import errno
 import logging
-import matplotlib.pyplot as plt
+import numpy as np
 import os
 from pathlib import Path
 import pandas as pd
-from PIL import Image
-from PIL import ImageEnhance
 import shutil
+import uuid
+try:
+    import fcntl
+except ImportError:
+    fcntl = None # not available on Windows (only needed for reflinks)
 
 logging.getLogger(__name__)
 
+# cv2.waitKeyEx() codes for arrow keys, which differ by platform/GUI backend
+ARROW_KEYS = {
+    65361: "left", 65362: "up", 65363: "right", 65364: "down",  # GTK (Linux)
+    16777234: "left", 16777235: "up", 16777236: "right", 16777237: "down",  # Qt
+    2424832: "left", 2490368: "up", 2555904: "right", 2621440: "down",  # Windows
+    63234: "left", 63232: "up", 63235: "right", 63233: "down",  # macOS
+}
+
+# cv2.imread() modes that decode at 1/scale resolution (JPEGs are decoded directly at reduced scale)
+REDUCED_READ_MODES = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+# Linux ioctl request to clone file contents copy-on-write (reflink)
+FICLONE = 0x40049409
+
 class ImageLabeler:
     """
-    A minimal image labeling and review tool using matplotlib.
+    A minimal image labeling and review tool using OpenCV.
 
     This class provides a lightweight interface for labeling image datasets manually.
     Images are displayed one at a time, and the user can assign a label via keyboard
@@ -67,10 +93,12 @@ class ImageLabeler:
         self.image_paths = self._load_image_paths() # all images in image_dir
         # list of (filename, label) tuples to save (saves every 10, or on quit)
         self.labels = [] 
+        self._csv_file = None # output_csv handle, opened for appending on first save
         self.current_index = 0
-        self.fig = None
-        self.ax = None
-        self.fontsize = 10
+        self.window_name = None # name of open OpenCV window, None when closed
+        self.font_scale = 0.5
+        self.display_size = (800, 800) # images are scaled to fit within this size
+        self.read_scale = 1 # reduced decode scale, picked from previous image size
 
     def run(self):
         """
@@ -84,12 +112,21 @@ class ImageLabeler:
             logging.warning("No valid images found or all images labeled.")
             return
 
-        self.fig, self.ax = plt.subplots(figsize=(5, 5))
-        self.fig.canvas.manager.set_window_title("Image Labeling Tool")
-        # connect key press event to custom handler method 
-        self.fig.canvas.mpl_connect("key_press_event", self._on_key)
-        self._update_display()
-        plt.show()
+        self._open_window("Image Labeling Tool")
+        try:
+            self._update_display()
+            # pass key presses to custom handler method until user quits or closes window
+            while self.window_name is not None:
+                key = self._wait_for_key()
+                if key is None:
+                    logging.info("Window closed. Saving labels...")
+                    break
+                self._on_key(key)
+        finally:
+            # save unsaved labels however labeling ended (including Ctrl-C or errors)
+            self._save_labels(force=True)
+            self._close_label_file()
+            self._close_window()
 
     def _load_image_paths(self):
         """
@@ -102,11 +139,14 @@ class ImageLabeler:
     def _get_all_image_paths(self):
         """
         Get all valid image files in image_dir based on allowed extensions.
+        Uses a single scandir pass: DirEntry.is_file() uses the file type cached 
+        from the directory listing, so no per-file stat is needed on most platforms.
         """
-        filenames = sorted(os.listdir(self.image_dir))
-        return [self.image_dir / fname for fname in filenames
-                if (self.image_dir / fname).is_file()
-                and (self.image_dir / fname).suffix.lower() in self.image_extensions]
+        with os.scandir(self.image_dir) as entries:
+            filenames = sorted(entry.name for entry in entries
+                               if entry.is_file()
+                               and os.path.splitext(entry.name)[1].lower() in self.image_extensions)
+        return [self.image_dir / fname for fname in filenames]
 
     def _get_labeled_filenames(self):
         """
@@ -116,8 +156,9 @@ class ImageLabeler:
         if not self.output_csv.exists():
             return set()
         try:
-            df = pd.read_csv(self.output_csv)
-            labeled_filenames = set(df["filename"].tolist())
+            # only filenames are needed, so skip parsing labels
+            df = pd.read_csv(self.output_csv, usecols=["filename"])
+            labeled_filenames = set(df["filename"].to_numpy())
             num_remaining = len(self._get_all_image_paths()) - len(labeled_filenames)
             logging.info(f"Resuming: Found {len(labeled_filenames)} labeled images. {num_remaining} images left to label.")
             return labeled_filenames
@@ -128,37 +169,46 @@ class ImageLabeler:
     def _save_labels(self, force=False):
         """
         Check if list of label tuples has passed threshold for saving.
-        If so, create df and save to CSV, and then clear tuples list. 
-        More efficient than saving to CSV after every label. If force is 
-        True, it will save (this is used when quitting early). 
+        If so, append them to the CSV, and then clear tuples list. 
+        More efficient than saving to CSV after every label, and appending 
+        means each save only costs the size of the batch, not the whole file. 
+        If force is True, it will save (this is used when quitting early). 
         """
         if len(self.labels) >= 10 or force:
             if self.labels:
-                new_df = pd.DataFrame(self.labels, columns=["filename", "label"])
                 try:
-                    if self.output_csv.exists():
-                        existing_df = pd.read_csv(self.output_csv)
-                        df = pd.concat([existing_df, new_df], ignore_index=True)
-                    else:
-                        df = new_df
-                    df.to_csv(self.output_csv, index=False)
+                    if self._csv_file is None:
+                        self._open_label_file()
+                    csv.writer(self._csv_file, lineterminator="\n").writerows(self.labels)
+                    self._csv_file.flush()
                     logging.info(f"Saved {len(self.labels)} labels to {self.output_csv}")
                     # clear labels after saving -- starting fresh
                     self.labels.clear()
                 except Exception as e:
                     logging.warning(f"Failed to save CSV. Labels kept in memory. Error: {e}")
 
-    def _update_display(self, maintain_zoom=False):
-        # if we maintaining zoom of current axes, save current limits
-        if maintain_zoom:
-            xlim = self.ax.get_xlim()
-            ylim = self.ax.get_ylim()
+    def _open_label_file(self):
+        """
+        Open output CSV for appending, kept open for the rest of the labeling 
+        session. Writes the header row if the file is new or empty.
+        """
+        write_header = not self.output_csv.exists() or self.output_csv.stat().st_size == 0
+        self._csv_file = open(self.output_csv, "a", newline="")
+        if write_header:
+            csv.writer(self._csv_file, lineterminator="\n").writerow(["filename", "label"])
+
+    def _close_label_file(self):
+        """
+        Close output CSV if it was opened for saving labels.
+        """
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
 
-        self.ax.clear()
+    def _update_display(self):
         try:
-            img = Image.open(self.image_paths[self.current_index])
+            img = self._load_image(self.image_paths[self.current_index])
             img = self._apply_brightness(img)
-            self.ax.imshow(img)
 
             # line 1 depends on whether current image is labeled
             filename = self.image_paths[self.current_index].name
@@ -171,20 +221,7 @@ class ImageLabeler:
             line2 = " | ".join([f"{i+1} = {cat}" for i, cat in enumerate(self.categories)])
             # line 3 contains instructions
             line3 = "left/right: next/prev | up/down = brightness | q = quit"
-            full_title = f"{line1}\n{line2}\n{line3}"
-            self.ax.set_title(full_title, fontsize=self.fontsize)
-
-            self.ax.set_xticks([])
-            self.ax.set_yticks([])
-
-            if maintain_zoom:
-                # Restore saved zoom limits
-                self.ax.set_xlim(xlim)
-                self.ax.set_ylim(ylim)
-
-            self.fig.canvas.draw()
-            self.fig.subplots_adjust(top=0.85)
-
+            self._show_image(img, [line1, line2, line3])
 
         except Exception as e:
             logging.warning(f"Failed to load {self.image_paths[self.current_index]}: {e}")
@@ -192,29 +229,145 @@ class ImageLabeler:
             if self.current_index < len(self.image_paths):
                 self._update_display()
             else:
-                self._save_labels(force=True)
-                plt.close(self.fig)
+                self._close_window()
 
+    def _open_window(self, window_name):
+        """
+        Open OpenCV window used to display images.
+        """
+        self.window_name = window_name
+        cv2.namedWindow(self.window_name, cv2.WINDOW_AUTOSIZE)
+
+    def _close_window(self):
+        """
+        Close OpenCV window if it is open. This ends the key handling loop.
+        """
+        if self.window_name is None:
+            return
+        try:
+            cv2.destroyWindow(self.window_name)
+            cv2.waitKey(1) # let GUI backend process the destroy event
+        except cv2.error:
+            pass # already closed by user
+        self.window_name = None
+
+    def _wait_for_key(self):
+        """
+        Wait for a key press in the window. Polls rather than blocking 
+        indefinitely, so the user closing the window is noticed too.
+
+        Returns
+        -------
+        str or None
+            Key pressed: the character ("q", "1", etc), or "left", "right", 
+            "up", "down" for arrow keys. None if the window was closed.
+        """
+        while cv2.getWindowProperty(self.window_name, cv2.WND_PROP_VISIBLE) >= 1:
+            key = cv2.waitKeyEx(50)
+            if key == -1:
+                continue
+            if key in ARROW_KEYS:
+                return ARROW_KEYS[key]
+            return chr(key & 0xFF)
+        return None
+
+    def _show_image(self, img, lines):
+        """
+        Show image in window, with lines of text drawn in a banner above it.
+
+        Parameters
+        ----------
+        img : numpy.ndarray
+            BGR image to show.
+        lines : list of str
+            Lines of text (filename/label, options, instructions).
+        """
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        margin = 10
+        (_, text_height), baseline = cv2.getTextSize("Ag", font, self.font_scale, 1)
+        line_height = text_height + baseline + 4
+        line_widths = [cv2.getTextSize(line, font, self.font_scale, 1)[0][0] for line in lines]
+
+        height, width = img.shape[:2]
+        banner_height = line_height * len(lines) + margin
+        canvas_width = max(width, max(line_widths) + 2 * margin)
+        canvas = np.full((banner_height + height, canvas_width, 3), 255, dtype=np.uint8)
+        x_offset = (canvas_width - width) // 2
+        canvas[banner_height:, x_offset:x_offset + width] = img
+
+        for i, (line, line_width) in enumerate(zip(lines, line_widths)):
+            origin = ((canvas_width - line_width) // 2, margin // 2 + (i + 1) * line_height - baseline)
+            cv2.putText(canvas, line, origin, font, self.font_scale, (0, 0, 0), 1, cv2.LINE_AA)
+
+        cv2.imshow(self.window_name, canvas)
+
+    def _load_image(self, image_path):
+        """
+        Load image for display, scaled to fit within display_size. 
+        
+        The display is only a few hundred pixels across, so JPEGs are decoded 
+        at reduced scale when possible: libjpeg decodes directly at 1/2, 1/4, 
+        or 1/8 scale, which is much faster and uses much less memory than a 
+        full-resolution decode. Image size isn't known until it is decoded, 
+        so the scale is picked based on the previous image (images in a dataset 
+        are usually all the same size). If that turns out too small for 
+        this image, it is decoded again at full resolution.
+
+        Parameters
+        ----------
+        image_path : Path
+            Path to image file.
+
+        Returns
+        -------
+        numpy.ndarray
+            Loaded BGR image.
+        """
+        img = cv2.imread(str(image_path), REDUCED_READ_MODES[self.read_scale])
+        if img is None:
+            raise ValueError(f"Could not read image {image_path}")
+
+        display_width, display_height = self.display_size
+        height, width = img.shape[:2]
+        if self.read_scale > 1 and width < display_width and height < display_height:
+            # reduced too far for this image: decode again at full resolution
+            img = cv2.imread(str(image_path), cv2.IMREAD_COLOR)
+            height, width = img.shape[:2]
+            full_width, full_height = width, height
+        else:
+            full_width, full_height = width * self.read_scale, height * self.read_scale
+
+        # for next image: largest reduction that still leaves enough pixels to fill display
+        self.read_scale = 1
+        for scale in (8, 4, 2):
+            if full_width // scale >= display_width or full_height // scale >= display_height:
+                self.read_scale = scale
+                break
+
+        fit_scale = min(display_width / width, display_height / height)
+        if fit_scale != 1:
+            interpolation = cv2.INTER_AREA if fit_scale < 1 else cv2.INTER_LINEAR
+            img = cv2.resize(img, (round(width * fit_scale), round(height * fit_scale)), 
+                             interpolation=interpolation)
+        return img
 
     def _apply_brightness(self, img):
         """
-        Apply brightness adjustment to a PIL Image using the current brightness.
+        Apply brightness adjustment to an image using the current brightness.
 
         Parameters
         ----------
-        img : PIL.Image
+        img : numpy.ndarray
             Original image.
 
         Returns
         -------
-        PIL.Image
+        numpy.ndarray
             Brightness-adjusted image.
         """
         if self.brightness == 1.0:
             return img
-        enhancer = ImageEnhance.Brightness(img)
-        return enhancer.enhance(self.brightness)
-
+        return cv2.convertScaleAbs(img, alpha=self.brightness)
 
     def _get_label_for_image(self, filename):
         """
@@ -238,44 +391,39 @@ class ImageLabeler:
 
         return None
 
-    def _on_key(self, event):
-        if event.key == "q":
+    def _on_key(self, key):
+        if key == "q":
             logging.info("Quitting. Saving labels...")
-            self._save_labels(force=True)
-            plt.close(self.fig)
+            self._close_window()
             return
 
-        maintain_zoom = False # default, only deviate if brightness changed
-        if event.key == "right":
+        if key == "right":
             self._go_forward_one_image()
 
-        elif event.key == "left":
+        elif key == "left":
             self._go_back_one_image()
 
-        elif event.key in self.category_keys:
-            self._label_current_image(event.key)
+        elif key in self.category_keys:
+            self._label_current_image(key)
 
-        elif event.key == "up":
+        elif key == "up":
             self.brightness *= 1.1
             logging.info(f"Brightness increased to {self.brightness:.1f}")
-            maintain_zoom = True
 
-        elif event.key == "down":
+        elif key == "down":
             self.brightness /= 1.1
             logging.info(f"Brightness decreased to {self.brightness:.1f}")
-            maintain_zoom = True
         
         else:
-            logging.info(f"Ignored key: {event.key}")
+            logging.info(f"Ignored key: {key}")
             return
 
         # Once key event processed: update display or finish if done
         if self.current_index < len(self.image_paths):
-            self._update_display(maintain_zoom=maintain_zoom)
+            self._update_display()
         else:
             logging.info("Finished labeling all images.")
-            self._save_labels(force=True)
-            plt.close(self.fig)
+            self._close_window()
 
     def _go_forward_one_image(self):
         """
@@ -322,7 +470,6 @@ class ImageLabeler:
 
         self.current_index += 1
 
-    # review_labels() and related methods unchanged from canonical code
     def review_labels(self):
         """
         The second main entry point for the user.
@@ -337,6 +484,11 @@ class ImageLabeler:
 
         try:
             df = pd.read_csv(self.output_csv)
+            # categorical labels are stored as small integer codes, so counting and 
+            # comparing labels doesn't hash strings. Include all categories so 
+            # relabeling to one not yet in the CSV is allowed.
+            categories = list(dict.fromkeys([*self.categories, *df["label"].dropna().unique()]))
+            df["label"] = pd.Categorical(df["label"], categories=categories)
             original_labels = list(zip(df["filename"], df["label"]))
             if not original_labels:
                 logging.warning("No labeled images in CSV.")
@@ -349,109 +501,122 @@ class ImageLabeler:
         self.review_index = 0
         self.review_labels = original_labels
         self.review_df = df
-        self.fig, self.ax = plt.subplots(figsize=(5, 5))
-        self.fig.canvas.manager.set_window_title("Label Review Tool")
-        self.fig.canvas.mpl_connect("key_press_event", self._on_review_key)
-        self._update_review_display()
-        plt.show()
-
-    def _on_review_key(self, event):
-        if event.key == "q":
-            logging.info("Quitting review.")
-            plt.close(self.fig)
+        # review_df row of each entry in review_labels (deleting from review_labels shifts positions)
+        self.review_rows = list(range(len(df)))
+        # deleted rows are masked out when saving rather than dropped from review_df
+        self.review_keep = np.ones(len(df), dtype=bool)
+        self.review_edits = 0 # edits not yet saved to CSV
+        self._open_window("Label Review Tool")
+        try:
+            self._update_review_display()
+            while self.window_name is not None:
+                key = self._wait_for_key()
+                if key is None:
+                    logging.info("Window closed. Saving edits...")
+                    break
+                self._on_review_key(key)
+        finally:
+            # save pending edits however the review ended (including Ctrl-C or errors)
+            self._save_review_edits(force=True)
+            self._close_window()
+
+    def _on_review_key(self, key):
+        if key == "q":
+            logging.info("Quitting review. Saving edits...")
+            self._close_window()
             return
 
-        maintain_zoom = False  # default
-
-        if event.key == "right":
+        if key == "right":
             self.review_index = min(self.review_index + 1, len(self.review_labels) - 1)
 
-        elif event.key == "left":
+        elif key == "left":
             self.review_index = max(self.review_index - 1, 0)
 
-        elif event.key == "d":
+        elif key == "d":
             self._delete_current_label()
 
-        elif event.key in self.category_keys:
-            self._relabel_current_image(event.key)
+        elif key in self.category_keys:
+            self._relabel_current_image(key)
 
-        elif event.key == "up":
+        elif key == "up":
             self.brightness *= 1.1
             logging.info(f"Brightness increased to {self.brightness:.1f}")
-            maintain_zoom = True
 
-        elif event.key == "down":
+        elif key == "down":
             self.brightness /= 1.1
             logging.info(f"Brightness decreased to {self.brightness:.1f}")
-            maintain_zoom = True
 
         else:
-            logging.info(f"Ignored key: {event.key}")
+            logging.info(f"Ignored key: {key}")
             return
 
-        self._update_review_display(maintain_zoom=maintain_zoom)
+        # window is closed if the last label was deleted
+        if self.window_name is not None:
+            self._update_review_display()
 
     def _relabel_current_image(self, key):
         new_label = self.categories[int(key) - 1]
         filename = self.review_labels[self.review_index][0]
-        original_label = self.review_df.at[self.review_index, "label"]
+        row = self.review_rows[self.review_index]
+        original_label = self.review_df.at[row, "label"]
 
         if new_label != original_label:
             logging.info(f"Relabeling {filename} to {new_label}")
-            self.review_df.at[self.review_index, "label"] = new_label
-            self.review_df.to_csv(self.output_csv, index=False)
+            self.review_df.at[row, "label"] = new_label
             self.review_labels[self.review_index] = (filename, new_label)
+            self.review_edits += 1
+            self._save_review_edits()
         else:
             logging.info(f"No change: {filename} remains labeled as {original_label}")
 
     def _delete_current_label(self):
         """
-        Delete the current label from the review set (both memory and disk).
-        Closes the viewer if no labels remain.
+        Delete the current label from the review set (in memory, saved 
+        to disk along with other edits). Closes the viewer if no labels remain.
         """
         filename = self.review_labels[self.review_index][0]
         logging.info(f"Removing label for {filename}")
 
-        self.review_df.drop(self.review_index, inplace=True)
-        self.review_df.to_csv(self.output_csv, index=False)
+        self.review_keep[self.review_rows.pop(self.review_index)] = False
         self.review_labels.pop(self.review_index)
+        self.review_edits += 1
+        self._save_review_edits()
 
         if not self.review_labels:
             logging.info("No more labeled images to review.")
-            plt.close(self.fig)
+            self._close_window()
             return
 
         if self.review_index >= len(self.review_labels):
             self.review_index = len(self.review_labels) - 1
 
-    def _update_review_display(self, maintain_zoom=False):
-
-        if maintain_zoom:
-            xlim = self.ax.get_xlim()
-            ylim = self.ax.get_ylim()
+    def _save_review_edits(self, force=False):
+        """
+        Check if number of unsaved review edits (relabels and deletions) has 
+        passed threshold for saving. If so, write reviewed labels to CSV, 
+        skipping deleted rows. More efficient than rewriting the CSV after 
+        every edit. If force is True, any pending edits are saved (this is 
+        used when quitting).
+        """
+        if self.review_edits >= 20 or (force and self.review_edits):
+            try:
+                self.review_df[self.review_keep].to_csv(self.output_csv, index=False)
+                logging.info(f"Saved {self.review_edits} review edits to {self.output_csv}")
+                self.review_edits = 0
+            except Exception as e:
+                logging.warning(f"Failed to save CSV. Edits kept in memory. Error: {e}")
 
-        self.ax.clear()
+    def _update_review_display(self):
         try:
             filename, label = self.review_labels[self.review_index]
-            img = Image.open(self.image_dir / filename)
+            img = self._load_image(self.image_dir / filename)
             img = self._apply_brightness(img)
-            self.ax.imshow(img)
 
             line1 = f"({filename}) Labeled {label} ({self.review_index + 1}/{len(self.review_labels)})"
             relabel_options = [f"Change to: {i+1} = {cat}" for i, cat in enumerate(self.categories) if cat != label]
             line2 = " | ".join(relabel_options) + " | d = delete"
             line3 = "left/right: next/prev | up/down = brightness | q = quit"
-            full_title = f"{line1}\n{line2}\n{line3}"
-            self.ax.set_title(full_title, fontsize=self.fontsize)
-
-            self.ax.set_xticks([])
-            self.ax.set_yticks([])
-            if maintain_zoom:
-                self.ax.set_xlim(xlim)
-                self.ax.set_ylim(ylim)
-
-            self.fig.canvas.draw()
-            self.fig.subplots_adjust(top=0.85)
+            self._show_image(img, [line1, line2, line3])
         except Exception as e:
             logging.warning(f"Failed to load {filename}: {e}")
             self.review_index += 1
@@ -459,14 +624,58 @@ class ImageLabeler:
                 self._update_review_display()
             else:
                 logging.info("No more labeled images to review.")
-                plt.close(self.fig)
+                self._close_window()
 
 
-def sort_images_by_label(labels_file, source_dir, output_dir):
+def _reflink(source, destination):
+    """
+    Create destination as a copy-on-write clone of source. Only works on Linux 
+    filesystems with reflink support (e.g., Btrfs, XFS), raises OSError otherwise.
+    """
+    if fcntl is None:
+        raise OSError(errno.ENOTSUP, "Reflinks not supported on this platform")
+    with open(source, "rb") as src, open(destination, "xb") as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    shutil.copystat(source, destination)
+
+
+def _place_image(source, destination, mode):
+    """
+    Put source image at destination as a hard link, reflink, or copy (mode is 
+    'link', 'reflink', or 'copy'). Links and reflinks fall back to copying when 
+    the filesystem can't make them (e.g., source and destination on different 
+    devices). Existing destination files are replaced.
+    """
+    if destination.exists() and os.path.samefile(source, destination):
+        if mode == "link":
+            return # already linked (e.g., sorting again)
+        destination.unlink() # replace earlier hard link with an independent file
+
+    if mode != "copy":
+        # link under temporary name then swap it in, as links can't overwrite existing files
+        # (name is unique so separate calls for the same destination can't clobber each other)
+        temp = destination.with_name(f".{destination.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            if mode == "link":
+                os.link(source, temp)
+            else:
+                _reflink(source, temp)
+            os.replace(temp, destination)
+            return
+        except OSError as e:
+            if temp.exists():
+                temp.unlink()
+            if destination.exists() and os.path.samefile(source, destination):
+                return # destination already linked to source, copying onto it would fail
+            logging.debug(f"Could not {mode} {source}, copying instead: {e}")
+    shutil.copy2(source, destination)
+
+
+def sort_images_by_label(labels_file, source_dir, output_dir, mode="link"):
     """
     Organize images into folders based on their labels stored in a CSV file.
 
-    Moves each image from the source directory into output directory 
+    Places each image from the source directory into output directory 
     under a subdirectory named after its label. The labels are read from a
     CSV file with two columns: 'filename' and 'label'. 
 
@@ -479,18 +688,27 @@ def sort_images_by_label(labels_file, source_dir, output_dir):
         Directory containing the original labeled images.
     output_dir : str or Path
         Directory where the reorganized image folders will be created.
+    mode : str, optional
+        How images are placed in output_dir. Default is 'link'.
+          'link': hard link, an instant new directory entry with no data copied
+          'reflink': copy-on-write clone (Linux filesystems like Btrfs, XFS)
+          'copy': full copy of the file
+        If a link or reflink can't be made (e.g., output_dir is on a different 
+        filesystem than source_dir), the image is copied instead.
 
     Returns
     -------
     None
-        Images are copied to `output_dir/label/filename`.
+        Images are placed at `output_dir/label/filename`.
 
     Notes
     -----
     - Label directories are created based on sorted label names to ensure deterministic ordering.
     - This avoids downstream issues with PyTorch's ImageFolder, which sorts subdirectories 
       to assign class indices.
-    - Files are copied, not moved, so the original images remain unchanged.
+    - Files are linked or copied, not moved, so the original images stay in place. 
+      A hard link shares data with the original: editing one in place edits both. 
+      Use mode='copy' if the sorted images need to be independent.
     """
     logging.info(f"Sorting images from {source_dir} to {output_dir}.")
     logging.info(f"Is using labels in {labels_file}")
@@ -499,24 +717,35 @@ def sort_images_by_label(labels_file, source_dir, output_dir):
     # check that required columns exist
     if not {'filename', 'label'}.issubset(df.columns):
         raise ValueError("labels_file must contain 'filename' and 'label' columns.")
+    if mode not in {"link", "reflink", "copy"}:
+        raise ValueError(f"mode must be 'link', 'reflink', or 'copy', not {mode!r}.")
     
     source_dir = Path(source_dir)
     output_dir = Path(output_dir)
-
-    # Sort labels to ensure consistent folder creation order
-    labels_sorted = sorted(df["label"].unique())
-
-    # Handle images for each label separately
-    for label in labels_sorted:
-        label_df = df[df["label"] == label]
-        label_dir = output_dir / label
-        label_dir.mkdir(parents=True, exist_ok=True)
-
-        for _, row in label_df.iterrows():
-            filename = row["filename"]
-            source = source_dir / filename
-            destination = label_dir / filename
-            shutil.copy2(source, destination)
+    # the labeler can save the same image/label more than once (e.g., after going back to 
+    # relabel), and workers must never handle the same destination concurrently
+    df = df.drop_duplicates(["filename", "label"])
+    # categorical labels make grouping work on integer codes rather than strings
+    df["label"] = df["label"].astype("category")
+
+    # Placing files is I/O bound (threads release the GIL during the syscalls), so spread
+    # the work across a thread pool to keep the disk busy
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        # Group once (sorted by label to ensure consistent folder creation order)
+        # and handle images for each label separately
+        for label, filenames in df.groupby("label", sort=True, observed=True)["filename"]:
+            label_dir = output_dir / label
+            label_dir.mkdir(parents=True, exist_ok=True)
+
+            for filename in filenames:
+                futures.append(executor.submit(_place_image, source_dir / filename, 
+                                               label_dir / filename, mode))
+
+        # surface any errors (e.g., missing source image)
+        for future in futures:
+            future.result()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,142 @@
+"""
+Tests for sightsprite.training utilities that don't need a display or camera.
+"""
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+pytest.importorskip("pandas")
+
+from sightsprite.training import ImageLabeler
+from sightsprite.training import sort_images_by_label
+
+
+def write_labels(labels_file, rows):
+    lines = ["filename,label"] + [f"{filename},{label}" for filename, label in rows]
+    labels_file.write_text("\n".join(lines) + "\n")
+
+
+# image filenames in the labeled_images fixture, by label
+IMAGES = {"cat": [f"cat{i:02d}.jpg" for i in range(10)],
+          "dog": [f"dog{i:02d}.jpg" for i in range(10)]}
+
+
+@pytest.fixture
+def labeled_images(tmp_path):
+    """
+    Source images and a labels CSV with many duplicate rows, like the labeler
+    produces when images are relabeled after a batch was saved.
+    """
+    source_dir = tmp_path / "images"
+    source_dir.mkdir()
+    rows = []
+    for label, filenames in IMAGES.items():
+        for filename in filenames:
+            (source_dir / filename).write_bytes(filename.encode())
+            rows += [(filename, label)] * 50
+
+    labels_file = tmp_path / "labels.csv"
+    write_labels(labels_file, rows)
+    return labels_file, source_dir
+
+
+def check_sorted(source_dir, output_dir, linked):
+    assert sorted(os.listdir(output_dir)) == sorted(IMAGES)
+    for label, filenames in IMAGES.items():
+        # no leftover temporary files
+        assert sorted(os.listdir(output_dir / label)) == filenames
+        for filename in filenames:
+            sorted_path = output_dir / label / filename
+            assert sorted_path.read_bytes() == filename.encode()
+            assert os.path.samefile(source_dir / filename, sorted_path) == linked
+
+
+@pytest.mark.parametrize("mode", ["link", "reflink", "copy"])
+def test_sort_images_with_duplicates_and_repeated_sorts(tmp_path, labeled_images, mode):
+    labels_file, source_dir = labeled_images
+    output_dir = tmp_path / "out"
+
+    for _ in range(3):
+        sort_images_by_label(labels_file, source_dir, output_dir, mode=mode)
+        check_sorted(source_dir, output_dir, linked=(mode == "link"))
+
+
+@pytest.mark.parametrize("first_mode, second_mode", [("link", "copy"), 
+                                                     ("link", "reflink"), 
+                                                     ("copy", "link")])
+def test_sort_images_switching_modes(tmp_path, labeled_images, first_mode, second_mode):
+    labels_file, source_dir = labeled_images
+    output_dir = tmp_path / "out"
+
+    sort_images_by_label(labels_file, source_dir, output_dir, mode=first_mode)
+    sort_images_by_label(labels_file, source_dir, output_dir, mode=second_mode)
+    check_sorted(source_dir, output_dir, linked=(second_mode == "link"))
+
+
+def test_sort_images_invalid_mode(tmp_path, labeled_images):
+    labels_file, source_dir = labeled_images
+    with pytest.raises(ValueError):
+        sort_images_by_label(labels_file, source_dir, tmp_path / "out", mode="move")
+
+
+def test_saved_labels_append_with_unix_line_endings(tmp_path, labeled_images):
+    _, source_dir = labeled_images
+    labels_file = tmp_path / "new_labels.csv"
+    # existing labels written by pandas, as review mode does
+    write_labels(labels_file, [("cat00.jpg", "cat")])
+
+    labeler = ImageLabeler(source_dir, ["cat", "dog"], output_csv=labels_file)
+    labeler.labels = [("cat01.jpg", "cat"), ("dog00.jpg", "dog")]
+    labeler._save_labels(force=True)
+    labeler._close_label_file()
+
+    assert labels_file.read_bytes() == (b"filename,label\ncat00.jpg,cat\n"
+                                        b"cat01.jpg,cat\ndog00.jpg,dog\n")
+
+
+def interrupt_after(labeler, keys):
+    """
+    Stand in for the OpenCV window: feed keys to the labeler, then raise
+    KeyboardInterrupt as if the user pressed Ctrl-C in the terminal.
+    """
+    keys = iter(keys)
+
+    def wait_for_key():
+        for key in keys:
+            return key
+        raise KeyboardInterrupt
+
+    labeler._open_window = lambda window_name: setattr(labeler, "window_name", window_name)
+    labeler._load_image = lambda image_path: np.zeros((8, 8, 3), dtype=np.uint8)
+    labeler._show_image = lambda img, lines: None
+    labeler._wait_for_key = wait_for_key
+
+
+def test_review_edits_saved_on_interrupt(tmp_path, labeled_images):
+    _, source_dir = labeled_images
+    labels_file = tmp_path / "review_labels.csv"
+    write_labels(labels_file, [("cat00.jpg", "cat"), ("dog00.jpg", "dog"), ("dog01.jpg", "dog")])
+
+    labeler = ImageLabeler(source_dir, ["cat", "dog"], output_csv=labels_file)
+    # relabel first image as dog, then delete second image's label
+    interrupt_after(labeler, ["2", "right", "d"])
+    with pytest.raises(KeyboardInterrupt):
+        labeler.review_labels()
+
+    assert labels_file.read_text() == "filename,label\ncat00.jpg,dog\ndog01.jpg,dog\n"
+
+
+def test_labels_saved_on_interrupt(tmp_path, labeled_images):
+    _, source_dir = labeled_images
+    labels_file = tmp_path / "run_labels.csv"
+
+    labeler = ImageLabeler(source_dir, ["cat", "dog"], output_csv=labels_file)
+    # label first two images (fewer than a full batch), then interrupt
+    interrupt_after(labeler, ["1", "1"])
+    with pytest.raises(KeyboardInterrupt):
+        labeler.run()
+
+    assert labeler._csv_file is None
+    assert labels_file.read_text() == "filename,label\ncat00.jpg,cat\ncat01.jpg,cat\n"